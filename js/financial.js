@@ -185,10 +185,17 @@ function calculateYearlyProjections(inputs, yearlyPrices) {
     
     const yearlyData = [];
     
+    // Compounding factors are carried from year to year instead of recomputed with Math.pow
+    const difficultyStep = 1 + inputs.difficultyGrowth;
+    const opexStep = 1 + CONSTANTS.DEFAULT_OPEX_INFLATION;
+    const discountStep = 1 + inputs.discountRate;
+    let difficultyFactor = 1;
+    let opexFactor = 1;
+    let discountFactor = 1;
+    
     for(let year = 1; year <= 5; year++) {
         const calendarYear = startYear + year - 1;
         const reward = getBlockReward(calendarYear);
-        const difficultyFactor = Math.pow(1 + inputs.difficultyGrowth, year - 1);
         const effectiveHashrate = hashratePH / difficultyFactor;
         const networkShare = effectiveHashrate / networkHashrate;
         
@@ -199,14 +206,14 @@ function calculateYearlyProjections(inputs, yearlyPrices) {
         const revenue = btcMined * yearPrice;
         totalRevenue += revenue;
         
-        const opex = projectData.totalOpex * Math.pow(1 + CONSTANTS.DEFAULT_OPEX_INFLATION, year - 1);
+        const opex = projectData.totalOpex * opexFactor;
         totalOpex5Year += opex;
         
         const netOpsFlow = revenue - opex;
         const cashFlow = netOpsFlow + annualDepreciation;
         cumulative += cashFlow;
         
-        const discountFactor = Math.pow(1 + inputs.discountRate, year);
+        discountFactor *= discountStep;
         npv += cashFlow / discountFactor;
         
         if (cumulative > 0 && paybackYear === 0) {
@@ -223,6 +230,9 @@ function calculateYearlyProjections(inputs, yearlyPrices) {
             cumulative,
             btcPrice: yearPrice 
         });
+        
+        difficultyFactor *= difficultyStep;
+        opexFactor *= opexStep;
     }
     
     return {
@@ -242,7 +252,6 @@ function calculateGpLpReturns(projections, structure, yearlyPrices) {
     
     // Equipment residual split by capital contribution
     const gpEquipmentShare = (structure.gpCapital / structure.totalCapex) * equipmentResidual;
-    const totalLpEquipmentShare = (structure.totalLpCapital / structure.totalCapex) * equipmentResidual;
     const investorEquipmentShare = (structure.investorCapital / structure.totalCapex) * equipmentResidual;
     
     // BTC split by profit share percentage
@@ -385,39 +394,50 @@ function updateLpCashFlowTable(lpYearly, structure) {
         return;
     }
     
-    tbody.innerHTML = '';
+    // Build every row (plus the total row) as one string and assign innerHTML once;
+    // the total-row sums are accumulated in the same pass
+    let sumBtcMined = 0;
+    let sumLpBtcShare = 0;
+    let sumInvestorBtcValue = 0;
     
-    lpYearly.forEach(data => {
-        const row = tbody.insertRow();
+    const rows = lpYearly.map(data => {
+        sumBtcMined += data.totalBtcMined || 0;
+        sumLpBtcShare += data.totalLpBtcShare || 0;
+        sumInvestorBtcValue += data.investorBtcValue || 0;
+        
         const roiColor = (data.cumulativeRoi || 0) >= 0 ? '#2d6a4f' : '#e74c3c';
         
-        row.innerHTML = `
-            <td><strong>Year ${data.year || 0}</strong> (${data.calendarYear || 0})</td>
-            <td class="number">${(data.totalBtcMined || 0).toFixed(4)}</td>
-            <td class="number">${(data.totalLpBtcShare || 0).toFixed(4)}</td>
-            <td class="number" style="color: #3498db; font-weight: 600;">${(data.investorBtcShare || 0).toFixed(4)}</td>
-            <td class="number">$${(data.investorBtcValue || 0).toLocaleString(undefined, {maximumFractionDigits: 0})}</td>
-            <td class="number" style="font-weight: 600;">${(data.cumulativeInvestorBtc || 0).toFixed(4)} BTC</td>
-            <td class="number" style="color: ${roiColor}; font-weight: 600;">${(data.cumulativeRoi || 0).toFixed(1)}%</td>
-            <td class="number">${(data.annualizedRoi || 0).toFixed(1)}%</td>
+        return `
+            <tr>
+                <td><strong>Year ${data.year || 0}</strong> (${data.calendarYear || 0})</td>
+                <td class="number">${(data.totalBtcMined || 0).toFixed(4)}</td>
+                <td class="number">${(data.totalLpBtcShare || 0).toFixed(4)}</td>
+                <td class="number" style="color: #3498db; font-weight: 600;">${(data.investorBtcShare || 0).toFixed(4)}</td>
+                <td class="number">$${(data.investorBtcValue || 0).toLocaleString(undefined, {maximumFractionDigits: 0})}</td>
+                <td class="number" style="font-weight: 600;">${(data.cumulativeInvestorBtc || 0).toFixed(4)} BTC</td>
+                <td class="number" style="color: ${roiColor}; font-weight: 600;">${(data.cumulativeRoi || 0).toFixed(1)}%</td>
+                <td class="number">${(data.annualizedRoi || 0).toFixed(1)}%</td>
+            </tr>
         `;
     });
     
     // Add total row
-    const totalRow = tbody.insertRow();
-    totalRow.classList.add('total-row');
     const finalData = lpYearly[lpYearly.length - 1] || {};
     
-    totalRow.innerHTML = `
-        <td><strong>5-YEAR TOTAL</strong></td>
-        <td class="number"><strong>${lpYearly.reduce((sum, d) => sum + (d.totalBtcMined || 0), 0).toFixed(4)} BTC</strong></td>
-        <td class="number"><strong>${lpYearly.reduce((sum, d) => sum + (d.totalLpBtcShare || 0), 0).toFixed(4)} BTC</strong></td>
-        <td class="number"><strong>${(finalData.cumulativeInvestorBtc || 0).toFixed(4)} BTC</strong></td>
-        <td class="number"><strong>$${lpYearly.reduce((sum, d) => sum + (d.investorBtcValue || 0), 0).toLocaleString(undefined, {maximumFractionDigits: 0})}</strong></td>
-        <td class="number"><strong>${(finalData.cumulativeInvestorBtc || 0).toFixed(4)} BTC</strong></td>
-        <td class="number"><strong>${(finalData.cumulativeRoi || 0).toFixed(1)}%</strong></td>
-        <td class="number"><strong>${(finalData.annualizedRoi || 0).toFixed(1)}%</strong></td>
-    `;
+    rows.push(`
+        <tr class="total-row">
+            <td><strong>5-YEAR TOTAL</strong></td>
+            <td class="number"><strong>${sumBtcMined.toFixed(4)} BTC</strong></td>
+            <td class="number"><strong>${sumLpBtcShare.toFixed(4)} BTC</strong></td>
+            <td class="number"><strong>${(finalData.cumulativeInvestorBtc || 0).toFixed(4)} BTC</strong></td>
+            <td class="number"><strong>$${sumInvestorBtcValue.toLocaleString(undefined, {maximumFractionDigits: 0})}</strong></td>
+            <td class="number"><strong>${(finalData.cumulativeInvestorBtc || 0).toFixed(4)} BTC</strong></td>
+            <td class="number"><strong>${(finalData.cumulativeRoi || 0).toFixed(1)}%</strong></td>
+            <td class="number"><strong>${(finalData.annualizedRoi || 0).toFixed(1)}%</strong></td>
+        </tr>
+    `);
+    
+    tbody.innerHTML = rows.join('');
 }
 
 function updateWaterfallVisualization(returns, structure) {
@@ -737,7 +737,6 @@ function updateSensitivityAnalysis(projections) {
     // Get base values
     const totalCapex = projectData.totalCapex || 0;
     const totalOpex = projectData.totalOpex || 0;
-    const baseHashratePH = projectData.totalHashratePH || 1;
 
     // BTC price scenarios
     const btcPrices = [150000, 120000, 100000, 80000, 60000];
@@ -750,39 +749,31 @@ function updateSensitivityAnalysis(projections) {
         { label: '50', mult: 0.5 }
     ];
 
+    // Simplified revenue calculation (proportional to hashrate and BTC price)
+    // Base revenue from projections, computed once for the whole grid
+    const baseRevenue = projections.yearlyData.reduce((sum, d) => sum + (d.revenue || 0), 0);
+    const baseBtcPrice = 100000; // Assume base price
+
     // Calculate IRR for each scenario
     btcPrices.forEach(btcPrice => {
+        // Revenue, OPEX (more miners = more costs), CAPEX and the equipment residual all
+        // scale linearly with the hashrate multiplier, and IRR is invariant to scaling every
+        // cash flow by the same factor. So the IRR only depends on the BTC price: solve it
+        // once per price row and reuse it for every hashrate column.
+        const adjustedRevenue = (baseRevenue / baseBtcPrice) * btcPrice;
+        const adjustedOpex = totalOpex * 5; // 5 years
+        const equipmentResidual = totalCapex * 0.25;
+
+        let irr = 0;
+        if (typeof calculateIRRSimplified === 'function' && totalCapex > 0) {
+            irr = calculateIRRSimplified(totalCapex, adjustedRevenue, adjustedOpex, equipmentResidual);
+        }
+
         hashrateMultipliers.forEach(hr => {
             const elementId = `sens_${btcPrice / 1000}_${hr.label}`;
             const element = document.getElementById(elementId);
 
             if (element) {
-                // Calculate revenue with adjusted hashrate
-                const adjustedHashrate = baseHashratePH * hr.mult;
-
-                // Simplified revenue calculation (proportional to hashrate and BTC price)
-                // Base revenue from projections, scaled by price and hashrate
-                const baseRevenue = projections.yearlyData.reduce((sum, d) => sum + (d.revenue || 0), 0);
-                const baseBtcPrice = 100000; // Assume base price
-
-                // Scale revenue by BTC price and hashrate
-                const adjustedRevenue = (baseRevenue / baseBtcPrice) * btcPrice * hr.mult;
-
-                // OPEX scales with hashrate (more miners = more costs)
-                const adjustedOpex = totalOpex * 5 * hr.mult; // 5 years
-
-                // CAPEX scales with hashrate
-                const adjustedCapex = totalCapex * hr.mult;
-
-                // Equipment residual
-                const equipmentResidual = adjustedCapex * 0.25;
-
-                // Calculate IRR
-                let irr = 0;
-                if (typeof calculateIRRSimplified === 'function' && adjustedCapex > 0) {
-                    irr = calculateIRRSimplified(adjustedCapex, adjustedRevenue, adjustedOpex, equipmentResidual);
-                }
-
                 // Format and display
                 if (isNaN(irr) || !isFinite(irr)) {
                     element.textContent = 'N/A';
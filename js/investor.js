@@ -107,6 +107,44 @@ function getCurrentInputs() {
     };
 }
 
+// Inputs are read from the DOM once per analysis run; calcCache is cleared at the start of each run
+function getCachedInputs() {
+    let inputs = calcCache.get('inputs');
+    if (!inputs) {
+        inputs = getCurrentInputs();
+        calcCache.set('inputs', inputs);
+    }
+    return inputs;
+}
+
+// Total BTC mined by the whole project over the first `years` years.
+// Memoized in calcCache: the scenario, exit and sensitivity tables re-request the same inputs many times per run.
+// Uptime scales every year's output equally, so the cache holds the 100%-uptime total and the
+// uptime sweeps (risk dashboard, sensitivities) reuse it instead of re-summing.
+function getTotalBtcMined(difficultyGrowth, uptime, years) {
+    const key = `btcMined:${difficultyGrowth}:${years}`;
+    let fullUptimeBtc = calcCache.get(key);
+    
+    if (fullUptimeBtc === undefined) {
+        const hashratePH = projectData.totalHashratePH;
+        const { networkHashrateEH } = getCachedInputs();
+        const startYear = projectData.startYear || 2026;
+        
+        fullUptimeBtc = 0;
+        
+        for(let year = 1; year <= years; year++) {
+            const calendarYear = startYear + year - 1;
+            const reward = getBlockReward(calendarYear);
+            const networkShare = calculateNetworkShare(hashratePH, networkHashrateEH, difficultyGrowth, year);
+            fullUptimeBtc += networkShare * CONSTANTS.BLOCKS_PER_YEAR * reward;
+        }
+        
+        calcCache.set(key, fullUptimeBtc);
+    }
+    
+    return fullUptimeBtc * uptime;
+}
+
 function getYearlyPrices(baseBtcPrice) {
     const prices = [];
     for (let i = 1; i <= 5; i++) {
@@ -183,19 +221,7 @@ function updateHeroSection(btcPrice, difficultyGrowth, uptime, yearlyPrices, str
 }
 
 function calculateLpMiningReturns(btcPrice, difficultyGrowth, uptime, yearlyPrices, structure) {
-    const hashratePH = projectData.totalHashratePH;
-    const { networkHashrateEH } = getCurrentInputs();
-    const startYear = projectData.startYear || 2026;
-    
-    let totalBtcMined = 0;
-    
-    for(let year = 1; year <= 5; year++) {
-        const calendarYear = startYear + year - 1;
-        const reward = getBlockReward(calendarYear);
-        const networkShare = calculateNetworkShare(hashratePH, networkHashrateEH, difficultyGrowth, year);
-        const btcMined = networkShare * CONSTANTS.BLOCKS_PER_YEAR * reward * uptime;
-        totalBtcMined += btcMined;
-    }
+    const totalBtcMined = getTotalBtcMined(difficultyGrowth, uptime, 5);
     
     // Total LP pool gets lpPercent of all BTC
     const totalLpBtcEarned = totalBtcMined * (structure.lpPercent / 100);
@@ -233,9 +259,8 @@ function updateScenarioComparison(difficultyGrowth, uptime, yearlyPrices, struct
     const tbody = document.getElementById('scenarioComparisonTable')?.querySelector('tbody');
     if (!tbody) return;
     
-    tbody.innerHTML = '';
-    
-    scenarios.forEach(price => {
+    // Build all rows as one string and assign innerHTML once instead of insertRow per scenario
+    tbody.innerHTML = scenarios.map(price => {
         const scenarioPrices = Array(5).fill(price);
         
         // Buy Strategy
@@ -264,20 +289,20 @@ function updateScenarioComparison(difficultyGrowth, uptime, yearlyPrices, struct
             rowStyle = '';
         }
         
-        const row = tbody.insertRow();
-        row.setAttribute('style', rowStyle);
-        row.innerHTML = `
-            <td><strong>$${price.toLocaleString()}</strong></td>
-            <td class="number">${btcIfBuy.toFixed(4)} BTC</td>
-            <td class="number">$${formatNumber(buyEndValue)}</td>
-            <td class="number">${buyRoi.toFixed(1)}%</td>
-            <td class="number">${mineResult.lpBtcEarned.toFixed(4)} BTC</td>
-            <td class="number">$${formatNumber(mineResult.totalValue)}</td>
-            <td class="number">${mineResult.roi.toFixed(1)}%</td>
-            <td style="color: ${winnerColor}; font-weight: 600;">${winner}</td>
-            <td class="number" style="color: ${winnerColor}; font-weight: 600;">${edge > 0 ? '+' : ''}${edge.toFixed(1)}%</td>
+        return `
+            <tr style="${rowStyle}">
+                <td><strong>$${price.toLocaleString()}</strong></td>
+                <td class="number">${btcIfBuy.toFixed(4)} BTC</td>
+                <td class="number">$${formatNumber(buyEndValue)}</td>
+                <td class="number">${buyRoi.toFixed(1)}%</td>
+                <td class="number">${mineResult.lpBtcEarned.toFixed(4)} BTC</td>
+                <td class="number">$${formatNumber(mineResult.totalValue)}</td>
+                <td class="number">${mineResult.roi.toFixed(1)}%</td>
+                <td style="color: ${winnerColor}; font-weight: 600;">${winner}</td>
+                <td class="number" style="color: ${winnerColor}; font-weight: 600;">${edge > 0 ? '+' : ''}${edge.toFixed(1)}%</td>
+            </tr>
         `;
-    });
+    }).join('');
 }
 
 // ============================================================================
@@ -291,8 +316,9 @@ function updateExitStrategy(btcPrice, difficultyGrowth, uptime, yearlyPrices, st
     
     if (!tbodyMine || !tbodyHold) return;
     
-    tbodyMine.innerHTML = '';
-    tbodyHold.innerHTML = '';
+    // Collect row markup and assign each tbody once after the loop
+    const mineRows = [];
+    const holdRows = [];
     
     // Buy at Year 0 (today) with base Bitcoin price
     const btcIfBuyInitial = structure.investorCapital / btcPrice;
@@ -305,17 +331,18 @@ function updateExitStrategy(btcPrice, difficultyGrowth, uptime, yearlyPrices, st
         const mineROI = structure.investorCapital > 0 ? ((exitResult.netReturn / structure.investorCapital) * 100).toFixed(1) : 0;
         const mineNetColor = exitResult.netReturn >= 0 ? '#2d6a4f' : '#e74c3c';
         
-        const rowMine = tbodyMine.insertRow();
-        rowMine.innerHTML = `
-            <td><strong>Year ${year}</strong></td>
-            <td class="number">${exitResult.lpBtcEarned.toFixed(4)} BTC</td>
-            <td class="number" style="color: #3498db; font-weight: 600;">$${formatNumber(exitYearPrice)}</td>
-            <td class="number">$${formatNumber(exitResult.btcValue)}</td>
-            <td class="number">$${formatNumber(exitResult.equipmentShare)}</td>
-            <td class="number">$${formatNumber(exitResult.totalRecovery)}</td>
-            <td class="number" style="color: ${mineNetColor}; font-weight: 600;">$${formatNumber(exitResult.netReturn)}</td>
-            <td class="number" style="color: ${mineNetColor}; font-weight: 600;">${mineROI}%</td>
-        `;
+        mineRows.push(`
+            <tr>
+                <td><strong>Year ${year}</strong></td>
+                <td class="number">${exitResult.lpBtcEarned.toFixed(4)} BTC</td>
+                <td class="number" style="color: #3498db; font-weight: 600;">$${formatNumber(exitYearPrice)}</td>
+                <td class="number">$${formatNumber(exitResult.btcValue)}</td>
+                <td class="number">$${formatNumber(exitResult.equipmentShare)}</td>
+                <td class="number">$${formatNumber(exitResult.totalRecovery)}</td>
+                <td class="number" style="color: ${mineNetColor}; font-weight: 600;">$${formatNumber(exitResult.netReturn)}</td>
+                <td class="number" style="color: ${mineNetColor}; font-weight: 600;">${mineROI}%</td>
+            </tr>
+        `);
         
         // HOLD Strategy Row
         const holdValue = btcIfBuyInitial * exitYearPrice;
@@ -323,17 +350,18 @@ function updateExitStrategy(btcPrice, difficultyGrowth, uptime, yearlyPrices, st
         const holdROI = structure.investorCapital > 0 ? ((holdNetReturn / structure.investorCapital) * 100).toFixed(1) : 0;
         const holdNetColor = holdNetReturn >= 0 ? '#2d6a4f' : '#e74c3c';
         
-        const rowHold = tbodyHold.insertRow();
-        rowHold.innerHTML = `
-            <td><strong>Year ${year}</strong></td>
-            <td class="number">${btcIfBuyInitial.toFixed(4)} BTC</td>
-            <td class="number" style="color: #3498db; font-weight: 600;">$${formatNumber(exitYearPrice)}</td>
-            <td class="number">$${formatNumber(holdValue)}</td>
-            <td class="number">$0</td>
-            <td class="number">$${formatNumber(holdValue)}</td>
-            <td class="number" style="color: ${holdNetColor}; font-weight: 600;">$${formatNumber(holdNetReturn)}</td>
-            <td class="number" style="color: ${holdNetColor}; font-weight: 600;">${holdROI}%</td>
-        `;
+        holdRows.push(`
+            <tr>
+                <td><strong>Year ${year}</strong></td>
+                <td class="number">${btcIfBuyInitial.toFixed(4)} BTC</td>
+                <td class="number" style="color: #3498db; font-weight: 600;">$${formatNumber(exitYearPrice)}</td>
+                <td class="number">$${formatNumber(holdValue)}</td>
+                <td class="number">$0</td>
+                <td class="number">$${formatNumber(holdValue)}</td>
+                <td class="number" style="color: ${holdNetColor}; font-weight: 600;">$${formatNumber(holdNetReturn)}</td>
+                <td class="number" style="color: ${holdNetColor}; font-weight: 600;">${holdROI}%</td>
+            </tr>
+        `);
         
         // Winner determination
         const holdROINum = parseFloat(holdROI);
@@ -357,22 +385,13 @@ function updateExitStrategy(btcPrice, difficultyGrowth, uptime, yearlyPrices, st
             winnerElement.style.color = winnerColor;
         }
     });
+    
+    tbodyMine.innerHTML = mineRows.join('');
+    tbodyHold.innerHTML = holdRows.join('');
 }
 
 function calculateLpExit(year, btcPrice, difficultyGrowth, uptime, yearlyPrices, structure) {
-    const hashratePH = projectData.totalHashratePH;
-    const { networkHashrateEH } = getCurrentInputs();
-    const startYear = projectData.startYear || 2026;
-    
-    let totalBtcMined = 0;
-    
-    for(let y = 1; y <= year; y++) {
-        const calendarYear = startYear + y - 1;
-        const reward = getBlockReward(calendarYear);
-        const networkShare = calculateNetworkShare(hashratePH, networkHashrateEH, difficultyGrowth, y);
-        const btcMined = networkShare * CONSTANTS.BLOCKS_PER_YEAR * reward * uptime;
-        totalBtcMined += btcMined;
-    }
+    const totalBtcMined = getTotalBtcMined(difficultyGrowth, uptime, year);
     
     // Total LP pool gets lpPercent
     const totalLpBtcEarned = totalBtcMined * (structure.lpPercent / 100);
@@ -422,19 +441,8 @@ function updateRiskDashboard(btcPrice, difficultyGrowth, uptime, yearlyPrices, s
 }
 
 function calculateBreakEvenPrice(difficultyGrowth, uptime, structure) {
-    const hashratePH = projectData.totalHashratePH;
-    const { networkHashrateEH } = getCurrentInputs();
-    const startYear = projectData.startYear || 2026;
-    
-    let totalBtcMined = 0;
-    
-    for(let year = 1; year <= 5; year++) {
-        const calendarYear = startYear + year - 1;
-        const reward = getBlockReward(calendarYear);
-        const networkShare = calculateNetworkShare(hashratePH, networkHashrateEH, difficultyGrowth, year);
-        const btcMined = networkShare * CONSTANTS.BLOCKS_PER_YEAR * reward * uptime;
-        totalBtcMined += btcMined;
-    }
+    // Same 5-year total as the base-case calculateLpMiningReturns call, so this is a cache hit
+    const totalBtcMined = getTotalBtcMined(difficultyGrowth, uptime, 5);
     
     // Total LP pool gets lpPercent
     const totalLpBtcEarned = totalBtcMined * (structure.lpPercent / 100);
@@ -481,21 +489,20 @@ function updateSensitivities(btcPrice, difficultyGrowth, uptime, yearlyPrices, s
     const tbody = document.getElementById('sensitivityTable')?.querySelector('tbody');
     if (!tbody) return;
     
-    tbody.innerHTML = '';
-    
-    sensitivities.forEach(sens => {
+    tbody.innerHTML = sensitivities.map(sens => {
         const downImpact = ((sens.downResult.totalValue - baseResult.totalValue) / baseResult.totalValue * 100).toFixed(1);
         const upImpact = ((sens.upResult.totalValue - baseResult.totalValue) / baseResult.totalValue * 100).toFixed(1);
         
-        const row = tbody.insertRow();
-        row.innerHTML = `
-            <td>${sens.variable}</td>
-            <td>${sens.baseCase}</td>
-            <td class="number">${downImpact}%</td>
-            <td class="number">+${upImpact}%</td>
-            <td class="number">${(parseFloat(upImpact) - parseFloat(downImpact)).toFixed(1)}%</td>
+        return `
+            <tr>
+                <td>${sens.variable}</td>
+                <td>${sens.baseCase}</td>
+                <td class="number">${downImpact}%</td>
+                <td class="number">+${upImpact}%</td>
+                <td class="number">${(parseFloat(upImpact) - parseFloat(downImpact)).toFixed(1)}%</td>
+            </tr>
         `;
-    });
+    }).join('');
 }
 
 // ============================================================================
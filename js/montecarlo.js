@@ -1,54 +1,133 @@
 // montecarlo.js - Monte Carlo Simulation for Buy vs Mine Decision
 // Parameter-based path generation using Geometric Brownian Motion
+// Dependencies: utils.js (CONSTANTS, getBlockReward)
 
 // Global variables to store simulation data
 let simulationResults = null;
 
+// Set to true to log simulation inputs, progress and the first scenario to the console
+const MC_VERBOSE = false;
+
+// Number of simulated paths listed in the sample scenarios table
+const MC_SAMPLE_SCENARIOS = 10;
+
+/**
+ * Log to the console only when MC_VERBOSE is enabled
+ */
+function mcLog(...args) {
+    if (MC_VERBOSE) console.log(...args);
+}
+
 /**
  * Generate correlated random paths using Geometric Brownian Motion
  * @param {number} S0 - Starting value
  * @param {number} mu - Expected annual return (as decimal, e.g., 0.25 for 25%)
  * @param {number} sigma - Annual volatility (as decimal, e.g., 0.60 for 60%)
- * @param {number} years - Number of years to project
+ * @param {number} numSteps - Number of time steps to project
  * @param {number} numPaths - Number of paths to generate
- * @param {Array} correlatedRandom - Optional array of correlated random numbers
- * @returns {Array} Array of paths, where each path is an array of values for each year
+ * @param {Float32Array} correlatedRandom - Optional flat (numPaths x numSteps, row-major) array of correlated random numbers
+ * @param {number} dt - Step length in years (default 1 = annual steps)
+ * @returns {Object} { values, numPaths, stride }: flat row-major Float64Array where path i
+ *          occupies values[i * stride] (start) through values[i * stride + stride - 1] (end)
  */
-function generateGBMPaths(S0, mu, sigma, years, numPaths, correlatedRandom = null) {
-    const paths = [];
-    const dt = 1; // Annual time step
+function generateGBMPaths(S0, mu, sigma, numSteps, numPaths, correlatedRandom = null, dt = 1) {
+    const stride = numSteps + 1;
+    
+    // All paths share one contiguous buffer, indexed by offset; no per-path view objects
+    const values = new Float64Array(numPaths * stride);
+    
+    // GBM coefficients are constant per call: S_t = S0 * exp(sum of (drift + diffusion*z))
+    const drift = (mu - 0.5 * sigma * sigma) * dt;
+    const diffusion = sigma * Math.sqrt(dt);
     
     for (let i = 0; i < numPaths; i++) {
-        const path = [S0]; // Start with initial value
+        const rowStart = i * stride;
+        values[rowStart] = S0; // Start with initial value
         
-        for (let t = 1; t <= years; t++) {
-            const S_prev = path[t - 1];
-            
+        // Accumulate log-returns and exponentiate from S0 (closed form), rather than
+        // compounding from the previous step
+        let logReturn = 0;
+        const zOffset = i * numSteps - 1;
+        
+        for (let t = 1; t <= numSteps; t++) {
             // Use correlated random if provided, otherwise generate new random
-            const z = correlatedRandom ? correlatedRandom[i][t-1] : randomNormal();
-            
-            // Geometric Brownian Motion formula: S_t = S_(t-1) * exp((mu - 0.5*sigma^2)*dt + sigma*sqrt(dt)*z)
-            const drift = (mu - 0.5 * sigma * sigma) * dt;
-            const diffusion = sigma * Math.sqrt(dt) * z;
-            const S_t = S_prev * Math.exp(drift + diffusion);
+            const z = correlatedRandom ? correlatedRandom[zOffset + t] : randomNormal();
             
-            path.push(S_t);
+            logReturn += drift + diffusion * z;
+            values[rowStart + t] = S0 * Math.exp(logReturn);
         }
-        
-        paths.push(path);
     }
     
-    return paths;
+    return { values, numPaths, stride };
+}
+
+/**
+ * Create a seeded uniform [0,1) generator (SFC32)
+ * The 32-bit seed is expanded into the 128-bit state with SplitMix32.
+ * @param {number} seed - Integer seed
+ * @returns {Function} Function returning uniform random numbers in [0, 1)
+ */
+function createSeededRandom(seed) {
+    let s = seed >>> 0;
+    const splitMix32 = () => {
+        s = (s + 0x9e3779b9) | 0;
+        let z = s;
+        z = Math.imul(z ^ (z >>> 16), 0x85ebca6b);
+        z = Math.imul(z ^ (z >>> 13), 0xc2b2ae35);
+        return (z ^ (z >>> 16)) >>> 0;
+    };
+    
+    let a = splitMix32(), b = splitMix32(), c = splitMix32(), d = splitMix32();
+    
+    return function() {
+        a >>>= 0; b >>>= 0; c >>>= 0; d >>>= 0;
+        const t = (a + b | 0) + d | 0;
+        d = d + 1 | 0;
+        a = b ^ (b >>> 9);
+        b = c + (c << 3) | 0;
+        c = (c << 21) | (c >>> 11);
+        c = c + t | 0;
+        return (t >>> 0) / 4294967296;
+    };
+}
+
+// Uniform source for the simulation; replaced by a seeded generator when a seed is given
+let mcRandom = Math.random;
+
+/**
+ * Set the random seed for subsequent simulations
+ * @param {number|null} seed - Integer seed, or null to use Math.random
+ */
+function setMonteCarloSeed(seed) {
+    mcRandom = (seed === null || seed === undefined || isNaN(seed)) ? Math.random : createSeededRandom(seed);
+    spareNormal = null;
 }
 
+// Second variate of the last polar-method pair, returned on the next call
+let spareNormal = null;
+
 /**
- * Generate standard normal random variable (Box-Muller transform)
+ * Generate standard normal random variable (Marsaglia polar method)
+ * Each accepted pair yields two independent normals without any trig calls;
+ * the second one is cached and returned by the next call.
  */
 function randomNormal() {
-    let u = 0, v = 0;
-    while(u === 0) u = Math.random(); // Converting [0,1) to (0,1)
-    while(v === 0) v = Math.random();
-    return Math.sqrt(-2.0 * Math.log(u)) * Math.cos(2.0 * Math.PI * v);
+    if (spareNormal !== null) {
+        const z = spareNormal;
+        spareNormal = null;
+        return z;
+    }
+    
+    let u, v, s;
+    do {
+        u = 2.0 * mcRandom() - 1.0;
+        v = 2.0 * mcRandom() - 1.0;
+        s = u * u + v * v;
+    } while (s >= 1.0 || s === 0);
+    
+    const factor = Math.sqrt(-2.0 * Math.log(s) / s);
+    spareNormal = v * factor;
+    return u * factor;
 }
 
 /**
@@ -56,38 +135,42 @@ function randomNormal() {
  * @param {number} numPaths - Number of simulation paths
  * @param {number} numSteps - Number of time steps
  * @param {number} rho - Correlation coefficient between -1 and 1
- * @returns {Object} Object with z1 and z2 arrays of correlated random numbers
+ * @param {boolean} antithetic - If true, the second half of the paths mirrors the first half (-z)
+ * @returns {Object} Object with z1 and z2 flat (numPaths x numSteps, row-major) arrays of correlated random numbers
  */
-function generateCorrelatedRandoms(numPaths, numSteps, rho) {
-    const z1 = [];
-    const z2 = [];
+function generateCorrelatedRandoms(numPaths, numSteps, rho, antithetic = false) {
+    const size = numPaths * numSteps;
+    
+    // Normal draws only need single precision; prices and ROI stay in Float64
+    const z1 = new Float32Array(size);
+    const z2 = new Float32Array(size);
     
     // Cholesky decomposition for correlation matrix
     // [1, rho]      [1,  0]
     // [rho, 1]  =   [rho, sqrt(1-rho^2)]
     
-    const a = 1;
-    const b = rho;
-    const c = Math.sqrt(1 - rho * rho);
+    // Clamp rho so the factor stays real: at |rho| = 1 the matrix is only semi-definite
+    // and the factor degenerates to z2 = rho * z1 instead of producing NaN draws
+    const r = Math.min(1, Math.max(-1, rho));
+    const c = Math.sqrt(1 - r * r);
     
-    for (let i = 0; i < numPaths; i++) {
-        const path1 = [];
-        const path2 = [];
-        
-        for (let t = 0; t < numSteps; t++) {
-            const e1 = randomNormal();
-            const e2 = randomNormal();
-            
-            // Transform to correlated normals
-            const w1 = a * e1;
-            const w2 = b * e1 + c * e2;
-            
-            path1.push(w1);
-            path2.push(w2);
-        }
+    // With antithetic variates only the first ceil(numPaths/2) paths are drawn
+    const drawn = antithetic ? Math.ceil(numPaths / 2) * numSteps : size;
+    
+    // Draws are independent across paths and steps, so fill both buffers in one pass
+    for (let k = 0; k < drawn; k++) {
+        const e1 = randomNormal();
+        const e2 = randomNormal();
         
-        z1.push(path1);
-        z2.push(path2);
+        // Transform to correlated normals
+        z1[k] = e1;
+        z2[k] = r * e1 + c * e2;
+    }
+    
+    // Antithetic paths: negated copies keep the correlation and halve the RNG work
+    for (let k = drawn; k < size; k++) {
+        z1[k] = -z1[k - drawn];
+        z2[k] = -z2[k - drawn];
     }
     
     return { z1, z2 };
@@ -103,7 +186,7 @@ function generateCorrelatedRandoms(numPaths, numSteps, rho) {
  */
 function runMonteCarloSimulation() {
     try {
-        console.log('=== STARTING MONTE CARLO SIMULATION ===');
+        mcLog('=== STARTING MONTE CARLO SIMULATION ===');
         
         // Get input parameters
         const numSims = parseInt(document.getElementById('numSimulations').value);
@@ -119,7 +202,11 @@ function runMonteCarloSimulation() {
         
         const investorCapital = parseFloat(document.getElementById('investorCapitalMC').value);
         
-        console.log('Input validation:', {
+        // Optional seed makes runs reproducible; blank uses Math.random
+        const seedInput = document.getElementById('mcSeed');
+        const seed = seedInput && seedInput.value !== '' ? parseInt(seedInput.value) : null;
+        
+        mcLog('Input validation:', {
             numSims, projectionYears, btcStartPrice, btcTargetPrice, 
             btcVolatility, investorCapital
         });
@@ -150,7 +237,7 @@ function runMonteCarloSimulation() {
             return;
         }
         
-        console.log('âœ“ Input validation passed');
+        mcLog('âœ“ Input validation passed');
         
         // Calculate drift parameters from target prices
         const btcDrift = Math.log(btcTargetPrice / btcStartPrice) / projectionYears + 0.5 * btcVolatility * btcVolatility;
@@ -158,64 +245,78 @@ function runMonteCarloSimulation() {
         
         // Calculate implied annual returns for logging
         const btcAnnualReturn = ((Math.pow(btcTargetPrice / btcStartPrice, 1/projectionYears) - 1) * 100).toFixed(1);
-        const hashAnnualReturn = ((Math.pow(hashTargetPrice / hashStartPrice, 1/projectionYears) - 1) * 100).toFixed(1);
         
         // Show loading state
         document.getElementById('mcInstructions').style.display = 'none';
         document.getElementById('mcResults').style.display = 'block';
         
-        console.log('=== MONTE CARLO SIMULATION START ===');
-        console.log('IMPORTANT: Mining calculation now matches Step 6 exactly!');
-        console.log(`Simulations: ${numSims}, Years: ${projectionYears}`);
-        console.log(`BTC: Start=$${btcStartPrice.toLocaleString()}, Target=$${btcTargetPrice.toLocaleString()}, Vol=${(btcVolatility*100).toFixed(1)}%`);
-        console.log(`     â†’ Implied Annual Return: ${btcAnnualReturn}%, Drift: ${(btcDrift*100).toFixed(2)}%`);
-        console.log(`Hash Price: NOT USED for mining (using Step 6 methodology instead)`);
-        console.log(`     Mining uses: Network share â†’ BTC mined â†’ Convert to $ at Year 5`);
+        if (MC_VERBOSE) {
+            console.log([
+                '=== MONTE CARLO SIMULATION START ===',
+                'IMPORTANT: Mining calculation now matches Step 6 exactly!',
+                `Simulations: ${numSims}, Years: ${projectionYears}`,
+                `BTC: Start=$${btcStartPrice.toLocaleString()}, Target=$${btcTargetPrice.toLocaleString()}, Vol=${(btcVolatility*100).toFixed(1)}%`,
+                `     â†’ Implied Annual Return: ${btcAnnualReturn}%, Drift: ${(btcDrift*100).toFixed(2)}%`,
+                `Hash Price: NOT USED for mining (using Step 6 methodology instead)`,
+                `     Mining uses: Network share â†’ BTC mined â†’ Convert to $ at Year 5`
+            ].join('\n'));
+        }
+        
+        // Only the start and Year N values of each path are used, and GBM log-returns are
+        // i.i.d. normal, so the N annual steps collapse into one step of length N
+        // (variance scales with time): 1 draw per path instead of N, same distribution
+        const numSteps = 1;
+        const stepYears = projectionYears;
         
         // Generate correlated random numbers
-        console.log('Generating correlated random numbers...');
+        mcLog('Generating correlated random numbers...');
+        setMonteCarloSeed(seed);
         const correlation = 0.7;
-        const correlatedRandoms = generateCorrelatedRandoms(numSims, projectionYears, correlation);
-        console.log('âœ“ Random numbers generated');
+        const correlatedRandoms = generateCorrelatedRandoms(numSims, numSteps, correlation, true);
+        mcLog('âœ“ Random numbers generated');
         
         // Generate BTC price paths
-        console.log('Generating BTC price paths...');
+        mcLog('Generating BTC price paths...');
         const btcPaths = generateGBMPaths(
             btcStartPrice,
             btcDrift,
             btcVolatility,
-            projectionYears,
+            numSteps,
             numSims,
-            correlatedRandoms.z1
+            correlatedRandoms.z1,
+            stepYears
         );
-        console.log('âœ“ BTC paths generated');
+        mcLog('âœ“ BTC paths generated');
         
-        // Generate Hash price paths (for reference only, not used in mining calc)
-        console.log('Generating Hash price paths (reference only)...');
+        // Generate Hash price paths (for reference only, not used in mining calc).
+        // They only appear in the sample scenarios table, so only those paths are built;
+        // path i reads the same z2 row either way, so the samples are unchanged.
+        mcLog('Generating Hash price paths (reference only)...');
         const hashPaths = generateGBMPaths(
             hashStartPrice,
             hashDrift,
             hashVolatility,
-            projectionYears,
-            numSims,
-            correlatedRandoms.z2
+            numSteps,
+            Math.min(numSims, MC_SAMPLE_SCENARIOS),
+            correlatedRandoms.z2,
+            stepYears
         );
-        console.log('âœ“ Hash paths generated');
+        mcLog('âœ“ Hash paths generated');
         
         // Run simulation for each path
-        console.log('Running buy vs mine simulations...');
+        mcLog('Running buy vs mine simulations...');
         const results = runSimulations(btcPaths, hashPaths, investorCapital, projectionYears);
-        console.log('âœ“ Simulations complete');
+        mcLog('âœ“ Simulations complete');
         
         // Store results
         simulationResults = results;
         
         // Display results
-        console.log('Displaying results...');
+        mcLog('Displaying results...');
         displayResults(results, numSims);
-        console.log('âœ“ Results displayed');
+        mcLog('âœ“ Results displayed');
         
-        console.log('=== SIMULATION COMPLETE ===');
+        mcLog('=== SIMULATION COMPLETE ===');
         
     } catch (error) {
         console.error('âŒ SIMULATION ERROR:', error);
@@ -233,8 +334,10 @@ function runMonteCarloSimulation() {
  * CRITICAL: Mining calculation MUST match Step 6 (investor.js) exactly!
  */
 function runSimulations(btcPaths, hashPaths, investorCapital, years) {
-    const buyResults = [];
-    const mineResults = [];
+    // One ROI per path, preallocated as typed arrays
+    const numPaths = btcPaths.numPaths;
+    const buyResults = new Float64Array(numPaths);
+    const mineResults = new Float64Array(numPaths);
     const scenarios = [];
     
     // Get mining parameters - with defensive checks
@@ -297,119 +400,107 @@ function runSimulations(btcPaths, hashPaths, investorCapital, years) {
         console.log('Using defaults: 600 EH/s, 5% difficulty growth, 96% uptime');
     }
     
-    console.log('=== MINING PARAMETERS (MATCHING STEP 6) ===');
-    console.log(`Total CAPEX: $${totalCapex.toLocaleString()}`);
-    console.log(`Annual OPEX: $${annualOpex.toLocaleString()}`);
-    console.log(`Total Hashrate: ${totalHashratePH.toFixed(2)} PH/s`);
-    console.log(`Network Hashrate: ${networkHashrateEH} EH/s`);
-    console.log(`Difficulty Growth: ${(difficultyGrowth * 100).toFixed(1)}%/year`);
-    console.log(`Uptime: ${(uptime * 100).toFixed(1)}%`);
-    console.log(`GP/LP Split: ${gpPercent}/${lpPercent}`);
-    console.log(`Investor LP Share: ${investorLpSharePercent.toFixed(1)}%`);
-    console.log(`Investor Profit Share: ${investorProfitSharePercent.toFixed(1)}%`);
-    console.log('==========================================');
-    
-    // Bitcoin constants
-    const BLOCKS_PER_YEAR = 52596;
-    const CURRENT_BLOCK_REWARD = 3.125;
-    const HALVING_YEAR = 2028;
-    const EQUIPMENT_RESIDUAL_PERCENT = 0.20;
-    
-    for (let i = 0; i < btcPaths.length; i++) {
-        const btcPath = btcPaths[i];
-        const hashPath = hashPaths[i]; // Not used for mining calculation!
+    if (MC_VERBOSE) {
+        console.log([
+            '=== MINING PARAMETERS (MATCHING STEP 6) ===',
+            `Total CAPEX: $${totalCapex.toLocaleString()}`,
+            `Annual OPEX: $${annualOpex.toLocaleString()}`,
+            `Total Hashrate: ${totalHashratePH.toFixed(2)} PH/s`,
+            `Network Hashrate: ${networkHashrateEH} EH/s`,
+            `Difficulty Growth: ${(difficultyGrowth * 100).toFixed(1)}%/year`,
+            `Uptime: ${(uptime * 100).toFixed(1)}%`,
+            `GP/LP Split: ${gpPercent}/${lpPercent}`,
+            `Investor LP Share: ${investorLpSharePercent.toFixed(1)}%`,
+            `Investor Profit Share: ${investorProfitSharePercent.toFixed(1)}%`,
+            '=========================================='
+        ].join('\n'));
+    }
+    
+    // ==========================================
+    // MINE STRATEGY: Use EXACT Step 6 calculation
+    // ==========================================
+    // BTC mined, equipment residual and OPEX do not depend on the BTC price path,
+    // so they are computed once here; only the Year 5 valuation varies per path.
+    const miningConfigured = totalHashratePH > 0 && totalCapex > 0;
+    let totalBtcMined = 0;
+    let investorBtcEarned = 0;
+    let investorEquipmentShare = 0;
+    let investorOpexShare = 0;
+    
+    if (miningConfigured) {
+        // Calculate BTC mined over 5 years (SAME AS STEP 6)
+        const networkHashratePH = networkHashrateEH * 1000;
+        
+        for (let year = 1; year <= years; year++) {
+            const calendarYear = startYear + year - 1;
+            
+            // Get block reward (accounts for halving)
+            const reward = getBlockReward(calendarYear);
+            
+            // Calculate network share (accounts for difficulty growth)
+            const difficultyFactor = Math.pow(1 + difficultyGrowth, year - 1);
+            const effectiveHashrate = totalHashratePH / difficultyFactor;
+            const networkShare = effectiveHashrate / networkHashratePH;
+            
+            // Calculate BTC mined this year
+            const btcMined = networkShare * CONSTANTS.BLOCKS_PER_YEAR * reward * uptime;
+            totalBtcMined += btcMined;
+        }
+        
+        // Calculate investor's BTC share based on profit split
+        const totalLpBtcEarned = totalBtcMined * (lpPercent / 100);
+        investorBtcEarned = isOwnerOperator ? 
+            totalBtcMined : 
+            (investorCapital / totalLpCapital) * totalLpBtcEarned;
+        
+        // Add equipment residual value
+        const equipmentResidual = totalCapex * CONSTANTS.EQUIPMENT_RESIDUAL_PERCENT;
+        investorEquipmentShare = (investorCapital / totalCapex) * equipmentResidual;
+        
+        // Calculate total costs for investor
+        investorOpexShare = isOwnerOperator ? 
+            (annualOpex * years) : 
+            (investorCapital / totalCapex) * (annualOpex * years);
+    }
+    
+    // Mine ROI is affine in the Year 5 BTC price:
+    // ((investorBtcEarned * price + equipment - capital - opex) / capital) * 100 = mineSlope * price + mineIntercept
+    // Without a mining setup both coefficients are 0, so the path loop needs no branch
+    const mineSlope = miningConfigured ? (investorBtcEarned / investorCapital) * 100 : 0;
+    const mineIntercept = miningConfigured ? ((investorEquipmentShare - investorCapital - investorOpexShare) / investorCapital) * 100 : 0;
+    
+    const btcValues = btcPaths.values;
+    const btcStride = btcPaths.stride;
+    
+    for (let i = 0; i < numPaths; i++) {
+        const btcStart = btcValues[i * btcStride];
+        const btcEnd = btcValues[i * btcStride + btcStride - 1]; // Year N price
         
         // ==========================================
         // BUY STRATEGY: Just buy BTC and hold
         // ==========================================
-        const btcBought = investorCapital / btcPath[0];
-        const btcFinalValue = btcBought * btcPath[years];
-        const buyROI = ((btcFinalValue - investorCapital) / investorCapital) * 100;
+        // Capital cancels out: ((capital / start) * end - capital) / capital = end / start - 1
+        const buyROI = (btcEnd / btcStart - 1) * 100;
         
         // ==========================================
-        // MINE STRATEGY: Use EXACT Step 6 calculation
+        // MINE STRATEGY: Value the mined BTC on this path
         // ==========================================
-        let mineROI = 0;
-        
-        if (totalHashratePH > 0 && totalCapex > 0) {
-            // Calculate BTC mined over 5 years (SAME AS STEP 6)
-            let totalBtcMined = 0;
-            
-            for (let year = 1; year <= years; year++) {
-                const calendarYear = startYear + year - 1;
-                
-                // Get block reward (accounts for halving)
-                const reward = calendarYear < HALVING_YEAR ? CURRENT_BLOCK_REWARD : CURRENT_BLOCK_REWARD / 2;
-                
-                // Calculate network share (accounts for difficulty growth)
-                const networkHashratePH = networkHashrateEH * 1000;
-                const difficultyFactor = Math.pow(1 + difficultyGrowth, year - 1);
-                const effectiveHashrate = totalHashratePH / difficultyFactor;
-                const networkShare = effectiveHashrate / networkHashratePH;
-                
-                // Calculate BTC mined this year
-                const btcMined = networkShare * BLOCKS_PER_YEAR * reward * uptime;
-                totalBtcMined += btcMined;
-            }
-            
-            // Calculate investor's BTC share based on profit split
-            const totalLpBtcEarned = totalBtcMined * (lpPercent / 100);
-            const investorBtcEarned = isOwnerOperator ? 
-                totalBtcMined : 
-                (investorCapital / totalLpCapital) * totalLpBtcEarned;
-            
-            // Convert BTC to dollars at Year 5 price
-            const btcValue = investorBtcEarned * btcPath[years];
-            
-            // Add equipment residual value
-            const equipmentResidual = totalCapex * EQUIPMENT_RESIDUAL_PERCENT;
-            const investorEquipmentShare = (investorCapital / totalCapex) * equipmentResidual;
-            
-            // Calculate total value
-            const totalValue = btcValue + investorEquipmentShare;
-            
-            // Calculate total costs for investor
-            const investorOpexShare = isOwnerOperator ? 
-                (annualOpex * years) : 
-                (investorCapital / totalCapex) * (annualOpex * years);
-            
-            // Net return = Total Value - Initial Investment - OPEX
-            const netReturn = totalValue - investorCapital - investorOpexShare;
-            
-            // ROI
-            mineROI = (netReturn / investorCapital) * 100;
-            
-            // Log first scenario for debugging
-            if (i === 0) {
-                console.log('=== FIRST SCENARIO MINING CALCULATION ===');
-                console.log(`Total BTC Mined (5 years): ${totalBtcMined.toFixed(4)} BTC`);
-                console.log(`Investor BTC Share: ${investorBtcEarned.toFixed(4)} BTC`);
-                console.log(`BTC Price Year 5: $${btcPath[years].toLocaleString()}`);
-                console.log(`BTC Value: $${btcValue.toLocaleString()}`);
-                console.log(`Equipment Residual: $${investorEquipmentShare.toLocaleString()}`);
-                console.log(`Total Value: $${totalValue.toLocaleString()}`);
-                console.log(`Initial Investment: $${investorCapital.toLocaleString()}`);
-                console.log(`OPEX (5 years): $${investorOpexShare.toLocaleString()}`);
-                console.log(`Net Return: $${netReturn.toLocaleString()}`);
-                console.log(`Mining ROI: ${mineROI.toFixed(1)}%`);
-                console.log('=========================================');
-            }
-        } else {
-            // No mining setup configured
-            mineROI = 0;
-        }
+        // Net return = BTC value at Year 5 price + equipment - initial investment - OPEX
+        // (0 when no mining setup is configured)
+        const mineROI = mineSlope * btcEnd + mineIntercept;
         
-        buyResults.push(buyROI);
-        mineResults.push(mineROI);
+        buyResults[i] = buyROI;
+        mineResults[i] = mineROI;
         
-        // Store first 10 scenarios for display
-        if (i < 10) {
+        // Store the first MC_SAMPLE_SCENARIOS scenarios for display
+        if (i < MC_SAMPLE_SCENARIOS) {
+            const hashRow = i * hashPaths.stride; // Not used for mining calculation!
             scenarios.push({
                 run: i + 1,
-                btcStart: btcPath[0],
-                btcEnd: btcPath[years],
-                hashStart: hashPath[0],
-                hashEnd: hashPath[years],
+                btcStart: btcStart,
+                btcEnd: btcEnd,
+                hashStart: hashPaths.values[hashRow],
+                hashEnd: hashPaths.values[hashRow + hashPaths.stride - 1],
                 buyROI: buyROI,
                 mineROI: mineROI,
                 winner: buyROI > mineROI ? 'Buy' : 'Mine',
@@ -418,6 +509,28 @@ function runSimulations(btcPaths, hashPaths, investorCapital, years) {
         }
     }
     
+    // Log first scenario for debugging (outside the per-path loop)
+    if (MC_VERBOSE && miningConfigured && numPaths > 0) {
+        const btcEndPrice = btcValues[btcStride - 1];
+        const btcValue = investorBtcEarned * btcEndPrice;
+        const totalValue = btcValue + investorEquipmentShare;
+        const netReturn = totalValue - investorCapital - investorOpexShare;
+        console.log([
+            '=== FIRST SCENARIO MINING CALCULATION ===',
+            `Total BTC Mined (5 years): ${totalBtcMined.toFixed(4)} BTC`,
+            `Investor BTC Share: ${investorBtcEarned.toFixed(4)} BTC`,
+            `BTC Price Year 5: $${btcEndPrice.toLocaleString()}`,
+            `BTC Value: $${btcValue.toLocaleString()}`,
+            `Equipment Residual: $${investorEquipmentShare.toLocaleString()}`,
+            `Total Value: $${totalValue.toLocaleString()}`,
+            `Initial Investment: $${investorCapital.toLocaleString()}`,
+            `OPEX (5 years): $${investorOpexShare.toLocaleString()}`,
+            `Net Return: $${netReturn.toLocaleString()}`,
+            `Mining ROI: ${mineResults[0].toFixed(1)}%`,
+            '========================================='
+        ].join('\n'));
+    }
+    
     return {
         buyResults,
         mineResults,
@@ -433,10 +546,10 @@ function runSimulations(btcPaths, hashPaths, investorCapital, years) {
 }
 
 /**
- * Calculate percentile from sorted array
+ * Calculate percentile from an ascending sorted array (linear interpolation)
+ * Callers sort once and reuse the sorted copy for every percentile
  */
-function percentile(arr, p) {
-    const sorted = arr.slice().sort((a, b) => a - b);
+function percentile(sorted, p) {
     const index = (p / 100) * (sorted.length - 1);
     const lower = Math.floor(index);
     const upper = Math.ceil(index);
@@ -445,20 +558,39 @@ function percentile(arr, p) {
 }
 
 /**
- * Calculate mean of array
+ * Count values strictly below `value` in an ascending sorted array (binary search)
  */
-function mean(arr) {
-    return arr.reduce((a, b) => a + b, 0) / arr.length;
+function countBelow(sorted, value) {
+    let lo = 0;
+    let hi = sorted.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (sorted[mid] < value) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
 }
 
 /**
- * Calculate standard deviation
+ * Calculate mean, (population) standard deviation, min and max in a single pass
+ * Uses Welford's update so the variance stays accurate without a second pass
  */
-function stdDev(arr) {
-    const avg = mean(arr);
-    const squareDiffs = arr.map(value => Math.pow(value - avg, 2));
-    const avgSquareDiff = mean(squareDiffs);
-    return Math.sqrt(avgSquareDiff);
+function summaryStats(arr) {
+    let avg = 0;
+    let m2 = 0;
+    let min = Infinity;
+    let max = -Infinity;
+    
+    for (let i = 0; i < arr.length; i++) {
+        const x = arr[i];
+        const delta = x - avg;
+        avg += delta / (i + 1);
+        m2 += delta * (x - avg);
+        if (x < min) min = x;
+        if (x > max) max = x;
+    }
+    
+    return { mean: avg, std: Math.sqrt(m2 / arr.length), min, max };
 }
 
 /**
@@ -467,45 +599,43 @@ function stdDev(arr) {
 function displayResults(results, numSims) {
     const { buyResults, mineResults, scenarios } = results;
     
+    // Sort each result set once (typed-array sort is numeric) and read every percentile from it
+    const buySorted = Float64Array.from(buyResults).sort();
+    const mineSorted = Float64Array.from(mineResults).sort();
+    
     // Calculate statistics
     const stats = {
         buy: {
-            p10: percentile(buyResults, 10),
-            p25: percentile(buyResults, 25),
-            p50: percentile(buyResults, 50),
-            p75: percentile(buyResults, 75),
-            p90: percentile(buyResults, 90),
-            mean: mean(buyResults),
-            std: stdDev(buyResults),
-            min: Math.min(...buyResults),
-            max: Math.max(...buyResults)
+            p10: percentile(buySorted, 10),
+            p25: percentile(buySorted, 25),
+            p50: percentile(buySorted, 50),
+            p75: percentile(buySorted, 75),
+            p90: percentile(buySorted, 90),
+            ...summaryStats(buyResults)
         },
         mine: {
-            p10: percentile(mineResults, 10),
-            p25: percentile(mineResults, 25),
-            p50: percentile(mineResults, 50),
-            p75: percentile(mineResults, 75),
-            p90: percentile(mineResults, 90),
-            mean: mean(mineResults),
-            std: stdDev(mineResults),
-            min: Math.min(...mineResults),
-            max: Math.max(...mineResults)
+            p10: percentile(mineSorted, 10),
+            p25: percentile(mineSorted, 25),
+            p50: percentile(mineSorted, 50),
+            p75: percentile(mineSorted, 75),
+            p90: percentile(mineSorted, 90),
+            ...summaryStats(mineResults)
         }
     };
     
-    // Calculate win rates
+    // Calculate win rates (comparisons add as 0/1, so the loop has no branches)
     let buyWins = 0;
     let mineWins = 0;
-    let buyLosses = 0;
-    let mineLosses = 0;
     
     for (let i = 0; i < buyResults.length; i++) {
-        if (buyResults[i] > mineResults[i]) buyWins++;
-        if (mineResults[i] > buyResults[i]) mineWins++;
-        if (buyResults[i] < 0) buyLosses++;
-        if (mineResults[i] < 0) mineLosses++;
+        buyWins += buyResults[i] > mineResults[i];
+        mineWins += mineResults[i] > buyResults[i];
     }
     
+    // Losses are the prefix of the sorted results below 0
+    const buyLosses = countBelow(buySorted, 0);
+    const mineLosses = countBelow(mineSorted, 0);
+    
     const buyWinRate = (buyWins / numSims) * 100;
     const mineWinRate = (mineWins / numSims) * 100;
     const buyDownside = (buyLosses / numSims) * 100;
@@ -563,7 +693,6 @@ function updatePercentileTable(stats) {
     ];
     
     percentiles.forEach(p => {
-        const pLabel = p.label.toLowerCase();
         document.getElementById(`detailBuy${p.label}`).textContent = p.buy.toFixed(1) + '%';
         document.getElementById(`detailMine${p.label}`).textContent = p.mine.toFixed(1) + '%';
         
@@ -795,20 +924,26 @@ function createDistributionChart(results) {
  * Create histogram from data
  */
 function createHistogram(data, numBins) {
-    const min = Math.min(...data);
-    const max = Math.max(...data);
+    let min = Infinity;
+    let max = -Infinity;
+    for (let i = 0; i < data.length; i++) {
+        if (data[i] < min) min = data[i];
+        if (data[i] > max) max = data[i];
+    }
     const binWidth = (max - min) / numBins;
     
-    const bins = [];
-    const counts = [];
+    // Preallocated plain arrays (Chart.js labels/data), filled by index
+    const bins = new Array(numBins);
+    const counts = new Array(numBins).fill(0);
     
     for (let i = 0; i < numBins; i++) {
-        const binStart = min + i * binWidth;
-        const binEnd = binStart + binWidth;
-        bins.push((binStart + binEnd) / 2);
-        
-        const count = data.filter(d => d >= binStart && d < binEnd).length;
-        counts.push(count);
+        bins[i] = min + (i + 0.5) * binWidth;
+    }
+    
+    // Single pass: each value goes straight to its bin; the max lands in the last bin
+    for (let i = 0; i < data.length; i++) {
+        const bin = binWidth > 0 ? Math.floor((data[i] - min) / binWidth) : 0;
+        counts[bin < numBins ? bin : numBins - 1]++;
     }
     
     return { bins, counts };
@@ -899,12 +1034,14 @@ function exportMCData() {
     
     const { buyResults, mineResults } = simulationResults;
     
-    // Create CSV content
-    let csv = 'Simulation,Buy_ROI,Mine_ROI,Winner\n';
+    // Create CSV content: one line per simulation into a preallocated array, joined once
+    const lines = new Array(buyResults.length + 1);
+    lines[0] = 'Simulation,Buy_ROI,Mine_ROI,Winner';
     for (let i = 0; i < buyResults.length; i++) {
         const winner = buyResults[i] > mineResults[i] ? 'Buy' : 'Mine';
-        csv += `${i+1},${buyResults[i].toFixed(2)},${mineResults[i].toFixed(2)},${winner}\n`;
+        lines[i + 1] = `${i+1},${buyResults[i].toFixed(2)},${mineResults[i].toFixed(2)},${winner}`;
     }
+    const csv = lines.join('\n') + '\n';
     
     // Create download
     const blob = new Blob([csv], { type: 'text/csv' });
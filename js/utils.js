@@ -38,16 +38,32 @@ function calculateIRR(initialInvestment, cashFlows) {
     const maxCF = Math.max(...cashFlows);
     if (maxCF <= 0) return -100;
     
+    // Seed from the undiscounted payback multiple: (sum(CF) / I)^(2 / (n + 1)) - 1
+    // lands close to the root for level cash flows, so Halley usually converges in 1-3 steps
     let irr = CONSTANTS.IRR_INITIAL_GUESS;
+    if (initialInvestment > 0) {
+        let totalCF = 0;
+        for (let year = 0; year < cashFlows.length; year++) totalCF += cashFlows[year];
+        if (totalCF > 0) {
+            irr = Math.min(Math.max(Math.pow(totalCF / initialInvestment, 2 / (cashFlows.length + 1)) - 1, -0.9), 5);
+        }
+    }
     
     for(let i = 0; i < CONSTANTS.IRR_MAX_ITERATIONS; i++) {
         let npv = -initialInvestment;
         let derivative = 0;
+        let secondDerivative = 0;
+        
+        // Carry 1/(1+irr)^year forward instead of two Math.pow calls per year
+        const v = 1 / (1 + irr);
+        let discount = 1;
         
         for(let year = 1; year <= cashFlows.length; year++) {
-            const discountFactor = Math.pow(1 + irr, year);
-            npv += cashFlows[year - 1] / discountFactor;
-            derivative -= year * cashFlows[year - 1] / Math.pow(1 + irr, year + 1);
+            discount *= v;
+            const pv = cashFlows[year - 1] * discount;
+            npv += pv;
+            derivative -= year * pv * v;
+            secondDerivative += year * (year + 1) * pv * v * v;
         }
         
         if(Math.abs(npv) < CONSTANTS.IRR_TOLERANCE) {
@@ -56,7 +72,15 @@ function calculateIRR(initialInvestment, cashFlows) {
         
         if (Math.abs(derivative) < 1e-10) break;
         
-        irr -= npv / derivative;
+        // Halley step (cubic convergence); fall back to Newton if the denominator degenerates
+        // Unlike plain Newton, this also converges on negative IRRs (operating cash flow < 0)
+        // instead of overshooting past the clamp and stalling at IRR_INITIAL_GUESS
+        const halleyDenominator = 2 * derivative * derivative - npv * secondDerivative;
+        if (Math.abs(halleyDenominator) > 1e-10) {
+            irr -= 2 * npv * derivative / halleyDenominator;
+        } else {
+            irr -= npv / derivative;
+        }
         
         if(irr < -0.99) irr = -0.99;
         if(irr > 10) irr = CONSTANTS.IRR_INITIAL_GUESS;